@@ -0,0 +1,183 @@
+"""
+MULTI-AGENT RESEARCH & ANALYSIS SYSTEM
+======================================
+
+PURPOSE:
+This script creates a two-agent conversation system where a Researcher and an Analyst
+discuss topics collaboratively. The Researcher provides factual information while the
+Analyst critically examines and provides insights on that information.
+
+ARCHITECTURE:
+- Researcher Agent: Gathers and presents facts on topics
+- Analyst Agent: Critically examines information and identifies patterns
+- Round-Robin Communication: Agents answer the opening round concurrently,
+  then alternate turns speaking
+- Message Limit: Conversation stops after 6 messages (3 turns each)
+
+WORKFLOW:
+1. Load and validate API credentials from environment variables (at import)
+2. Get the shared Gemini AI model client
+3. Create two specialized AI agents with distinct roles
+4. Organize agents into round-robin discussion team
+5. Start collaborative discussion on specified topic
+6. Display real-time conversation in console
+7. Automatically end after message limit reached
+8. Clean up API connections when run_async() finishes
+
+REQUIREMENTS:
+- .env file containing: GEMINI_API_KEY=your_api_key_here
+- Python packages: autogen-agentchat==0.7.5 (pinned for fanout_chat.py), autogen-ext, python-dotenv, httpx[http2], diskcache
+- Optional (semantic response cache): sentence-transformers, faiss-cpu
+
+USAGE:
+python script_name.py
+
+The agents will automatically discuss AI's impact on society.
+"""
+
+# ============================================================================
+# SECTION 1: IMPORTS - Load Required Libraries
+# ============================================================================
+
+# Core AutoGen models for message handling
+from autogen_core.models import UserMessage
+
+# Shared Gemini model client (one per process)
+# (llm_client also loads the .env file and fails fast if GEMINI_API_KEY is missing)
+from llm_client import get_model_client, run_async
+
+# Standard library imports
+import sys  # Direct access to stdout for the prebuilt header
+
+# AutoGen agent and team components
+from autogen_agentchat.agents import AssistantAgent  # AI-powered agent class
+from autogen_agentchat.ui import Console  # Terminal/console interface for displaying conversations
+from autogen_agentchat.conditions import TextMentionTermination, MaxMessageTermination  # Conversation stopping rules
+
+# Round-robin team that runs independent rounds concurrently
+from fanout_chat import FanoutMergeGroupChat
+
+# Shared, cache-stable agent system messages
+from prompts import ANALYST_SYS, RESEARCHER_SYS
+
+# ============================================================================
+# SECTION 2: ENVIRONMENT CONFIGURATION
+# ============================================================================
+
+# Environment variables are loaded once from the .env file in llm_client.py,
+# which exposes GEMINI_API_KEY and the shared model capabilities (MODEL_INFO)
+# ⚠️ Security: Never hardcode API keys in source code - always use environment variables
+
+# Conversation header, built once at import and written with a single call
+_HEADER = "\n" + "=" * 60 + "\nMULTI-AGENT CONVERSATION - ROUND ROBIN\n" + "=" * 60 + "\n\n"
+
+
+# ============================================================================
+# SECTION 3: MAIN APPLICATION LOGIC
+# ============================================================================
+
+async def main():
+    """
+    Main asynchronous function that orchestrates the multi-agent conversation.
+
+    This function:
+    1. Gets the shared Gemini AI model client (API key validated at import)
+    2. Creates two specialized agents (Researcher and Analyst)
+    3. Sets up a round-robin conversation team
+    4. Executes the discussion on AI's societal impact
+
+    The opening round fans out to both agents concurrently, then the conversation
+    follows a round-robin pattern:
+    (Researcher + Analyst) -> Researcher speaks -> Analyst responds...
+    """
+
+    print("In AI Agent!")
+
+    # -------------------------------------------------------------------------
+    # Step 1: Get the Shared Gemini API Client
+    # -------------------------------------------------------------------------
+    # The client is created once per process (see llm_client.py) and reused
+    # by every agent, so its HTTP connections stay open across turns
+    # Identical or closely paraphrased requests are served from the on-disk
+    # response cache instead of the network (0.9 similarity suits open-ended
+    # discussion prompts)
+    # max_tokens=256 caps each response (both agents are told to keep responses concise),
+    # since decoding time grows with output length
+    model_client = get_model_client(semantic_cache=True, similarity_threshold=0.9, max_tokens=256)
+
+    # -------------------------------------------------------------------------
+    # Step 2: Create Researcher Agent
+    # -------------------------------------------------------------------------
+    # The Researcher agent focuses on gathering and presenting factual information
+    # Its role is to provide accurate, well-researched data on topics
+    researcher = AssistantAgent(
+        name="Researcher",  # Unique identifier (must be valid Python identifier - no spaces)
+        model_client=model_client,  # Connect this agent to Gemini AI
+        # No token streaming: this agent answers the opening round concurrently with the
+        # other one, and Console would interleave both token streams under one header
+        system_message=RESEARCHER_SYS  # Defines agent's personality and behavior (shared, cache-stable; see prompts.py)
+    )
+
+    # -------------------------------------------------------------------------
+    # Step 3: Create Analyst Agent
+    # -------------------------------------------------------------------------
+    # The Analyst agent critically examines information provided by the Researcher
+    # Its role is to identify patterns, ask questions, and provide insights
+    analyst = AssistantAgent(
+        name="Analyst",  # Unique identifier
+        model_client=model_client,  # Connect this agent to Gemini AI
+        # No token streaming: this agent answers the opening round concurrently with the
+        # other one, and Console would interleave both token streams under one header
+        system_message=ANALYST_SYS  # Defines agent's analytical role (shared, cache-stable; see prompts.py)
+    )
+
+    # -------------------------------------------------------------------------
+    # Step 4: Create Fan-Out / Round-Robin Team
+    # -------------------------------------------------------------------------
+    # Organize the two agents into a structured conversation team
+    # The opening round is independent (both agents just give their perspective),
+    # so both agents answer it concurrently; later rounds depend on earlier
+    # output and take turns in order:
+    # (Researcher + Analyst) -> Researcher -> Analyst -> ...
+    team = FanoutMergeGroupChat(
+        participants=[researcher, analyst],  # List of agents participating in conversation
+        independent_rounds=[0],  # Rounds where all agents speak at once
+        termination_condition=MaxMessageTermination(max_messages=6)  # Stop after 6 messages (3 turns each)
+    )
+    # Note: With 6 messages, each agent speaks exactly 3 times
+
+    # -------------------------------------------------------------------------
+    # Step 5: Display Conversation Header
+    # -------------------------------------------------------------------------
+    # Print formatted header to indicate conversation start (prebuilt, one write)
+    sys.stdout.write(_HEADER)
+    sys.stdout.flush()
+
+    # -------------------------------------------------------------------------
+    # Step 6: Execute the Conversation
+    # -------------------------------------------------------------------------
+    # Start the agent conversation and stream results to console
+    # Console() displays each agent's message as soon as it is complete
+    # run_stream() enables streaming mode for better user experience
+    result = await Console(
+        team.run_stream(
+            task="""Discuss the topic: 'The Impact of Artificial Intelligence on Society'.
+               Each agent should contribute their perspective based on their role.
+               After everyone has spoken twice, the Critic should say TERMINATE."""
+            # Note: The "Critic" mention in the task is a typo - there's no Critic agent
+            # The conversation will end based on MaxMessageTermination instead
+        )
+    )
+    # Note: The shared model client is closed once when run_async() finishes (llm_client.py)
+
+
+# ============================================================================
+# SECTION 4: APPLICATION ENTRY POINT
+# ============================================================================
+
+# Execute the main function on an event loop
+# run_async() runs the async function on uvloop when installed (Linux/macOS),
+# otherwise on the standard asyncio loop (asyncio.run), then closes the loop
+# The __main__ guard keeps imports (e.g. from tests) from starting a conversation
+if __name__ == "__main__":
+    run_async(main())
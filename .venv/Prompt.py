@@ -0,0 +1,319 @@
+"""
+INTERACTIVE MATH TUTORING SYSTEM
+=================================
+
+PURPOSE:
+This script creates an interactive math tutoring application using AI. A human student
+can ask math questions and receive personalized help from an AI-powered math teacher.
+The system demonstrates human-AI collaboration using Google's Gemini AI model.
+
+ARCHITECTURE:
+- Student (UserProxyAgent): Represents the human user, allows manual input
+- Math Teacher (AssistantAgent): AI-powered tutor using Gemini 2.0
+- Round-Robin Communication: Student and teacher alternate turns
+- Text-Based Termination: Session ends when student says "DONE"
+
+WORKFLOW:
+1. Load and validate API credentials from environment variables (at import)
+2. Get the shared Gemini AI model client
+3. Create AI math teacher agent with teaching instructions
+4. Create student proxy agent for human interaction
+5. Set up round-robin conversation team (built once per run, reused across its sessions)
+6. Start interactive tutoring session
+7. Allow real-time Q&A between student and teacher
+8. End session when student says "DONE"
+9. Clean up API resources when run_async() finishes
+
+REQUIREMENTS:
+- .env file containing: GEMINI_API_KEY=your_api_key_here
+- Python packages: autogen-agentchat, autogen-ext, python-dotenv, httpx[http2], diskcache
+- Optional (Gemini prefix caching): google-genai
+
+USAGE:
+python script_name.py
+
+Then interact by typing math questions when prompted.
+Type "DONE" to end the session.
+
+As a library: `await session("...")` runs a session on the shared, reusable team.
+
+SECURITY:
+- API keys stored securely in .env file
+- Never commit .env to version control
+- Add .env to .gitignore
+"""
+
+# ============================================================================
+# SECTION 1: IMPORTS - Load Required Libraries and Modules
+# ============================================================================
+
+# Core AutoGen components for message handling
+from autogen_core.models import UserMessage  # Represents user messages in conversation
+
+# Shared Gemini model client (one per process)
+# (llm_client also loads the .env file and fails fast if GEMINI_API_KEY is missing)
+from llm_client import create_prefix_cache, get_model_client, run_async
+
+# Standard Python libraries for async operations
+import asyncio  # Enables asynchronous/concurrent operations
+import sys  # Direct access to stdout for the prebuilt banners
+
+# AutoGen agent types for different roles
+from autogen_agentchat.agents import AssistantAgent  # AI-powered agent
+from autogen_agentchat.agents import UserProxyAgent  # Human user proxy agent
+
+# UI and team management components
+from autogen_agentchat.ui import Console  # Console interface for displaying conversations
+from autogen_agentchat.teams import RoundRobinGroupChat  # Manages turn-taking between agents
+
+# Conversation control conditions
+from termination import MultiKeywordTermination  # Stops on any of several phrases
+from autogen_agentchat.conditions import MaxMessageTermination  # Stops after N messages
+
+
+# ============================================================================
+# SECTION 2: ENVIRONMENT SETUP - Load Sensitive Configuration
+# ============================================================================
+
+# Environment variables are loaded once from the .env file in llm_client.py,
+# which exposes GEMINI_API_KEY and the shared model capabilities (MODEL_INFO)
+# ⚠️ Security Best Practice: Never hardcode API keys directly in source code
+
+# CACHE-STABLE PREFIX: the teacher's system message is kept byte-identical across
+# runs so the provider can reuse its prompt-prefix cache (and so it matches the
+# Gemini cached content created from it); per-session instructions belong in the
+# task message instead. The 'DONE' -> 'LESSON COMPLETE' rule never changes, so it
+# lives here: every session can end, whatever task it starts with
+TEACHER_SYSTEM_MESSAGE = """You are a helpful math teacher. Help the user learn math concepts clearly and patiently.
+        - Explain step-by-step solutions
+        - Use simple language appropriate for the student's level
+        - Provide examples when helpful
+        - Encourage the student and build confidence
+        - When the student says 'DONE', acknowledge their progress and say 'LESSON COMPLETE'"""
+
+# Session header and completion banner, built once at import and written with a single call each
+_HEADER = (
+    "\n" + "=" * 60 + "\nMATH TUTORING SESSION - ROUND ROBIN\n" + "=" * 60
+    + "\nAsk math questions and type 'DONE' when finished\n\n"
+)
+_FOOTER = "\n" + "=" * 60 + "\n✅ SESSION COMPLETE - Thank you for learning!\n" + "=" * 60 + "\n"
+
+
+# ============================================================================
+# SECTION 3: MAIN APPLICATION LOGIC - Core Tutoring System
+# ============================================================================
+
+# Opening prompt for the default tutoring session
+# (the end-of-lesson rule is part of the teacher's system message)
+DEFAULT_TASK = """I need help with algebra. Can you help me understand how to solve linear equations?"""
+
+# Tutoring team, built once per event loop and reused across its sessions (see get_team())
+_team = None
+_team_loop = None
+_team_lock = None
+
+
+async def build_team():
+    """
+    Build the tutoring team: a Gemini-powered math teacher and a human student proxy.
+
+    This is the one-time setup part of a tutoring session:
+    1. Shared model client lookup (API key validated at import)
+    2. Agent creation with specific roles and behaviors
+    3. Team setup for structured conversation
+
+    Returns:
+        RoundRobinGroupChat: Team ready to run tutoring sessions
+    """
+
+    # -------------------------------------------------------------------------
+    # Step 1: Get the Shared Gemini API Client
+    # -------------------------------------------------------------------------
+    # The client is created once per process (see llm_client.py) and reused
+    # across agents and sessions, so its HTTP connections stay open between turns
+    # Identical requests are served from the on-disk response cache instead of
+    # the network; only the exact-match tier is used, since student questions that
+    # differ only in their numbers ("2x+3=7" vs "2x+3=9") embed almost identically
+    # and a semantic match would answer the wrong equation
+    # max_tokens=512 caps each response (room for step-by-step explanations, but no runaway answers),
+    # since decoding time grows with output length
+    # The teacher's system message is stored as Gemini cached content, so each
+    # turn only pays for processing the new messages (None if caching isn't available,
+    # or, as for the current short prompt, the message is below Gemini's minimum
+    # cacheable size; then no cache request is made at all)
+    prefix_cache = await create_prefix_cache(TEACHER_SYSTEM_MESSAGE)
+    model_client = get_model_client(
+        exact_cache=True,
+        max_tokens=512,
+        prefix_cache=prefix_cache
+    )
+    # Note: The base_url points to Google's Gemini API, which uses OpenAI-compatible format
+
+    # -------------------------------------------------------------------------
+    # Step 2: Create the AI Math Teacher Agent
+    # -------------------------------------------------------------------------
+    # This agent is powered by Gemini AI and acts as a knowledgeable math tutor
+    # It can explain concepts, solve problems, and guide students through learning
+    teacher = AssistantAgent(
+        name="MathTeacher",  # Unique identifier (must be valid Python identifier - no spaces!)
+        model_client=model_client,  # Connect this agent to the Gemini API client
+        model_client_stream=True,  # Stream tokens to the console as they arrive
+        system_message=TEACHER_SYSTEM_MESSAGE  # Cache-stable prefix (see SECTION 2)
+        # The system_message defines the agent's personality, role, and behavior guidelines
+    )
+
+    # -------------------------------------------------------------------------
+    # Step 3: Create the Student Proxy Agent (Human Interface)
+    # -------------------------------------------------------------------------
+    # UserProxyAgent represents the human user in the conversation
+    # It allows manual input and passes human messages to the AI teacher
+    student_proxy = UserProxyAgent(
+        name="MathStudent"  # Unique identifier for the student
+    )
+    # Note: UserProxyAgent prompts the user for input during the conversation
+    # This creates an interactive experience where the human can ask questions
+
+    # -------------------------------------------------------------------------
+    # Step 4: Set Up Conversation Termination Condition
+    # -------------------------------------------------------------------------
+    # Define when the tutoring session should end
+    # The session stops when the teacher says "LESSON COMPLETE" (or "TERMINATE")
+    # All phrases are matched with one precompiled regex scan per message
+    # Only the teacher's messages are checked, so a student (or task) quoting
+    # 'LESSON COMPLETE' doesn't end the session
+    termination = MultiKeywordTermination(["LESSON COMPLETE", "TERMINATE"], sources=[teacher.name])
+    # The conversation will automatically end when the teacher says one of these phrases
+    # (the condition resets itself after each session, so the team can be reused)
+
+    # -------------------------------------------------------------------------
+    # Step 5: Create Round-Robin Team for Structured Conversation
+    # -------------------------------------------------------------------------
+    # Organize the student and teacher into a structured conversation team
+    # Round-robin ensures they take turns speaking:
+    # Student asks question -> Teacher responds -> Student asks -> Teacher responds...
+    team = RoundRobinGroupChat(
+        participants=[student_proxy, teacher],  # List of agents in the conversation
+        termination_condition=termination  # Condition that ends the conversation
+    )
+    # The order in participants list determines who speaks first (student_proxy)
+
+    return team
+
+
+async def get_team():
+    """
+    Return the shared tutoring team, building it on first call.
+    Later sessions on the same event loop reuse the same agents, team and model client.
+
+    The team is rebuilt on a new event loop (e.g. a later run_async() call), since
+    the model client it holds was closed when the previous run_async() finished.
+    """
+    global _team, _team_loop, _team_lock
+
+    loop = asyncio.get_running_loop()
+    if _team_loop is not loop:
+        _team, _team_loop, _team_lock = None, loop, asyncio.Lock()
+
+    async with _team_lock:
+        if _team is None:
+            _team = await build_team()
+
+    return _team
+
+
+async def run_session(team, task):
+    """
+    Run one interactive tutoring session on an existing team.
+
+    The team is reset first, so each session starts with a fresh conversation
+    while keeping the already-built agents.
+
+    Args:
+        team (RoundRobinGroupChat): Team from build_team() / get_team()
+        task (str): Opening message for the session
+
+    Returns:
+        TaskResult: Messages exchanged during the session
+    """
+
+    # -------------------------------------------------------------------------
+    # Step 6: Display Session Header
+    # -------------------------------------------------------------------------
+    # Print a formatted header to clearly indicate the tutoring session has begun (prebuilt, one write)
+    sys.stdout.write(_HEADER)
+    sys.stdout.flush()
+
+    # -------------------------------------------------------------------------
+    # Step 7: Execute the Interactive Tutoring Session
+    # -------------------------------------------------------------------------
+    # Clear the previous session's conversation but keep the agents
+    await team.reset()
+
+    # Start the conversation and stream responses in real-time to the console
+    # Console() displays tokens as they're generated for better UX (model_client_stream=True)
+    # run_stream() enables streaming mode where responses appear progressively
+    result = await Console(
+        team.run_stream(
+            task=task
+            # This is the initial prompt that starts the conversation
+            # The teacher will respond to this, then the student can ask follow-up questions
+        )
+    )
+    # The conversation continues until the student types "DONE" and teacher says "LESSON COMPLETE"
+
+    # -------------------------------------------------------------------------
+    # Step 8: Session Completion and Cleanup
+    # -------------------------------------------------------------------------
+    # Display completion message (prebuilt, one write)
+    sys.stdout.write(_FOOTER)
+    sys.stdout.flush()
+
+    # Note: The shared model client is closed once when run_async() finishes (llm_client.py)
+    return result
+
+
+async def session(task=DEFAULT_TASK):
+    """
+    Run a tutoring session on the shared team (for use as a library).
+
+    Args:
+        task (str, optional): Opening message. Defaults to the algebra lesson.
+
+    Returns:
+        TaskResult: Messages exchanged during the session
+    """
+    return await run_session(await get_team(), task)
+
+
+async def main():
+    """
+    Main asynchronous function that runs one math tutoring session.
+
+    This function creates an interactive learning environment where:
+    - A human student (via UserProxyAgent) can ask math questions
+    - An AI teacher (via AssistantAgent) provides explanations and guidance
+    - Conversation flows naturally in round-robin fashion
+    - Session ends when student types "DONE"
+
+    Returns:
+        None - Function runs the interactive session and displays output to console
+    """
+
+    # Display welcome message to indicate session start
+    print("🎓 Starting Math Tutoring Session\n")
+
+    await session(DEFAULT_TASK)
+
+
+# ============================================================================
+# SECTION 4: APPLICATION ENTRY POINT - Program Execution
+# ============================================================================
+
+# Execute the main async function on an event loop
+# run_async() does the following:
+# 1. Creates a new event loop (uvloop when installed on Linux/macOS, else asyncio's default)
+# 2. Runs the async main() function in that loop
+# 3. Closes the loop when main() completes
+# The __main__ guard keeps imports (e.g. from tests) from starting a conversation
+if __name__ == "__main__":
+    run_async(main())
@@ -0,0 +1,151 @@
+"""
+SIMPLE GEMINI AI ASSISTANT WITH FILE SYSTEM ACCESS
+==================================================
+A basic example of using Google's Gemini AI to answer questions
+and save responses to files using MCP (Model Context Protocol).
+"""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+from autogen_ext.tools.mcp import StdioServerParams, McpWorkbench
+from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.ui import Console
+
+# Environment variables (.env) are loaded once when llm_client is imported,
+# which also fails fast if GEMINI_API_KEY is missing ( Vault can be used also)
+from llm_client import get_model_client, run_async
+
+# Directory the assistant may read/write: where this script is located ( Change location if needed)
+# Resolved once at import, with forward slashes (works on Windows too)
+_CURRENT_DIR_STR = str(Path(__file__).parent.resolve()).replace("\\", "/")
+
+# File system MCP server binary, looked up once (None if it isn't installed)
+_FS_SERVER_BIN = shutil.which("mcp-server-filesystem")
+
+# Fail fast if the pre-installed file system MCP server doesn't come up
+MCP_STARTUP_TIMEOUT_SECONDS = 5
+
+# The 'npx -y' fallback may first download the server package (cold npm cache),
+# so it gets a generous startup timeout instead
+NPX_STARTUP_TIMEOUT_SECONDS = 120
+
+def getFileServerMCP():
+    """
+    Create and return an MCP workbench for file system operations.
+    This allows the AI assistant to read/write files in the same directory as this script.
+
+    Uses the pre-installed 'mcp-server-filesystem' binary when available
+    (npm i -g @modelcontextprotocol/server-filesystem), which skips the
+    'npx -y' package lookup on every start. Falls back to npx otherwise.
+    """
+    print(f"📁 File system access granted to: {_CURRENT_DIR_STR}\n")
+
+    if _FS_SERVER_BIN:
+        command = _FS_SERVER_BIN
+        args = [_CURRENT_DIR_STR]
+    else:
+        command = "npx"
+        args = [
+            "-y",
+            "@modelcontextprotocol/server-filesystem",
+            _CURRENT_DIR_STR
+        ]
+
+    fileSystemParameters = StdioServerParams(
+        command=command,
+        args=args,
+        read_timeout_seconds=60
+    )
+
+    # Create and return the MCP workbench
+    fs_workbench = McpWorkbench(fileSystemParameters)
+    return fs_workbench
+
+
+async def startFileServerMCP():
+    """
+    Create and start the file system MCP workbench, waiting until the server is ready.
+
+    McpWorkbench.start() only schedules the server in the background, so the
+    tool list is fetched inside the timeout: that waits for the process to spawn
+    and the MCP handshake to finish, and fails fast if the server doesn't come up.
+    The pre-installed binary gets MCP_STARTUP_TIMEOUT_SECONDS; the npx fallback
+    gets NPX_STARTUP_TIMEOUT_SECONDS, since it may have to download the package.
+
+    Returns:
+        McpWorkbench: Started workbench (the caller stops it)
+
+    Raises:
+        asyncio.TimeoutError: If the server doesn't start within its timeout
+    """
+    timeout = MCP_STARTUP_TIMEOUT_SECONDS if _FS_SERVER_BIN else NPX_STARTUP_TIMEOUT_SECONDS
+
+    fs_workbench = getFileServerMCP()
+    await fs_workbench.start()
+    try:
+        await asyncio.wait_for(fs_workbench.list_tools(), timeout=timeout)
+    except BaseException:
+        await fs_workbench.stop()
+        raise
+
+    return fs_workbench
+
+
+async def main():
+    """
+    Simple assistant that answers questions using Gemini AI
+    and can save responses to files in the same directory as this script.
+    """
+    print("Hello World!")
+
+    # Start the file server MCP workbench in the background first: the process
+    # spawn and MCP handshake then overlap with the model client setup below
+    fs_task = asyncio.create_task(startFileServerMCP())
+
+    # Stop the MCP server when done for proper resource management
+    try:
+        # Get the shared Gemini model client (closed once when run_async() finishes),
+        # answering repeated requests from the on-disk response cache
+        # (strict 0.98 similarity since the question is factual)
+        # Built in a worker thread, since loading the cache packages is slow
+        # and would otherwise block the MCP startup running on the event loop
+        model = await asyncio.to_thread(
+            get_model_client, semantic_cache=True, similarity_threshold=0.98
+        )
+
+        # Wait for the file server only now that it's actually needed
+        fcb = await fs_task
+
+        # Create assistant agent with file system access
+        assistant = AssistantAgent(
+            name="assistant",
+            model_client=model,
+            model_client_stream=True,  # Stream tokens to the console as they arrive
+            workbench=fcb  # Gives assistant access to file operations
+        )
+
+        # Run the assistant with a question
+        await Console(
+            assistant.run_stream(
+                task="What is the capital city of India? Save the answer in a text file called 'answer.txt'"
+            )
+        )
+
+        print("\n✅ Task completed! Check the 'answer.txt' file in the same folder as this script.")
+    finally:
+        # Stop the file server (or abandon its startup if it never got that far)
+        fs_task.cancel()  # No-op if the startup already finished
+        try:
+            fcb = await fs_task
+        except (asyncio.CancelledError, Exception):
+            fcb = None  # Startup failed or was cancelled; it already stopped itself
+        if fcb is not None:
+            await fcb.stop()
+
+
+# Run the async main function (on uvloop when available)
+# Only when run as a script, so importing this module doesn't start a conversation
+if __name__ == "__main__":
+    run_async(main())
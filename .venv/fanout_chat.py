@@ -0,0 +1,105 @@
+"""
+FAN-OUT / MERGE GROUP CHAT
+==========================
+A RoundRobinGroupChat variant for rounds where the agents don't depend on
+each other's output (e.g. everyone gives an opening perspective on a topic).
+
+In an "independent" round every participant is asked to speak at once and
+their replies are merged into the conversation together, so two LLM calls
+take max(t1, t2) instead of t1 + t2. All other rounds fall back to normal
+round-robin turn-taking.
+
+REQUIREMENTS:
+- Python packages: autogen-agentchat==0.7.5
+  The round-robin manager and config classes are imported from a private
+  autogen module (not exported from autogen_agentchat.teams), so the version
+  is pinned; check this module when upgrading autogen.
+"""
+
+from autogen_agentchat.teams import RoundRobinGroupChat
+# Private module: see the version pin in REQUIREMENTS above
+from autogen_agentchat.teams._group_chat._round_robin_group_chat import (
+    RoundRobinGroupChatConfig,
+    RoundRobinGroupChatManager,
+)
+
+
+class FanoutMergeGroupChatManager(RoundRobinGroupChatManager):
+    """
+    Group chat manager that selects every participant during independent rounds
+    and the next round-robin speaker otherwise.
+    """
+
+    def __init__(self, *args, independent_rounds, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._independent_rounds = frozenset(independent_rounds)
+        self._round_index = 0
+
+    async def reset(self):
+        await super().reset()
+        self._round_index = 0
+
+    async def select_speaker(self, thread):
+        """
+        Select the speaker(s) for the next round.
+
+        Returns:
+            list[str] | str: All participant names for an independent round
+                             (dispatched concurrently), otherwise a single name.
+        """
+        round_index = self._round_index
+        self._round_index += 1
+
+        if round_index in self._independent_rounds:
+            return list(self._participant_names)
+
+        return await super().select_speaker(thread)
+
+
+class FanoutMergeGroupChatConfig(RoundRobinGroupChatConfig):
+    """Declarative configuration for FanoutMergeGroupChat (adds the independent rounds)."""
+
+    independent_rounds: list[int] = [0]
+
+
+class FanoutMergeGroupChat(RoundRobinGroupChat):
+    """
+    Round-robin team whose independent rounds fan out to all participants concurrently.
+
+    Args:
+        participants: Agents taking part in the conversation
+        independent_rounds (Iterable[int], optional): Zero-based round numbers in which
+                                                      all participants speak at once.
+                                                      Defaults to the opening round only.
+        **kwargs: Passed through to RoundRobinGroupChat (termination_condition, max_turns, ...)
+    """
+
+    component_config_schema = FanoutMergeGroupChatConfig
+    component_provider_override = "fanout_chat.FanoutMergeGroupChat"
+
+    def __init__(self, participants, independent_rounds=(0,), **kwargs):
+        super().__init__(participants, **kwargs)
+        self._independent_rounds = tuple(independent_rounds)
+
+    def _to_config(self):
+        """Dump the round-robin settings plus the independent rounds (used by dump_component())."""
+        config = super()._to_config()
+        return FanoutMergeGroupChatConfig(**dict(config), independent_rounds=list(self._independent_rounds))
+
+    @classmethod
+    def _from_config(cls, config):
+        """Rebuild the team from a FanoutMergeGroupChatConfig (used by load_component())."""
+        team = super()._from_config(config)
+        team._independent_rounds = tuple(config.independent_rounds)
+        return team
+
+    def _create_group_chat_manager_factory(self, *args, **kwargs):
+        def _factory():
+            return FanoutMergeGroupChatManager(
+                *args,
+                emit_team_events=self._emit_team_events,
+                independent_rounds=self._independent_rounds,
+                **kwargs
+            )
+
+        return _factory
@@ -0,0 +1,302 @@
+"""
+LLM RESPONSE CACHE
+==================
+Wraps a chat completion client with an on-disk response cache.
+
+Tier 1 - exact match:
+The demo scripts send the same system messages and task text on every run,
+so identical requests are answered from the cache instead of the network.
+The cache key is a SHA-256 of the model settings, messages, tools and request
+parameters, so any change to the conversation produces a new key.
+
+Tier 2 - semantic match (optional):
+Paraphrased prompts ("solve linear equations" vs "solving linear equations")
+miss the exact tier. When a similarity threshold is given, the last user
+message is embedded and compared (cosine similarity, FAISS inner-product
+index) with earlier prompts that share the same conversation prefix; a close
+enough match is served from the cache.
+
+REQUIREMENTS:
+- Python packages: autogen-core, diskcache
+- Optional (semantic tier; without them only exact matches are served):
+  sentence-transformers, faiss-cpu, numpy
+"""
+
+import asyncio
+import hashlib
+import json
+
+from autogen_core.models import ChatCompletionClient, CreateResult, UserMessage
+from autogen_core.tools import Tool
+from diskcache import Cache
+
+# Directory holding the on-disk response cache
+DEFAULT_CACHE_DIR = ".llm_cache"
+
+# Sentence embedding model used by the semantic tier
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Shared embedding model (loaded on first use, it is slow to construct)
+_embedder = None
+
+
+def _get_embedder():
+    """Load the sentence embedding model once per process."""
+    global _embedder
+
+    if _embedder is None:
+        from sentence_transformers import SentenceTransformer
+        _embedder = SentenceTransformer(EMBEDDING_MODEL)
+
+    return _embedder
+
+
+def _hash(payload):
+    """Return a stable SHA-256 hex digest of a JSON-serializable payload."""
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CachingChatClient(ChatCompletionClient):
+    """
+    Chat completion client that serves repeated requests from a disk cache.
+
+    All calls other than create() / create_stream() are forwarded to the
+    wrapped client unchanged.
+
+    Args:
+        inner (ChatCompletionClient): The client that performs real requests
+        cache_dir (str, optional): Directory for the on-disk cache.
+                                   Defaults to '.llm_cache'.
+        semantic_threshold (float, optional): Minimum cosine similarity for a
+                                              semantic cache hit. If None, only
+                                              exact matches are served. If the
+                                              semantic tier's packages are missing,
+                                              a warning is printed and only exact
+                                              matches are served as well.
+    """
+
+    def __init__(self, inner, cache_dir=DEFAULT_CACHE_DIR, semantic_threshold=None):
+        self._inner = inner
+        self._cache = Cache(cache_dir)
+        self._semantic_threshold = semantic_threshold
+
+        # Semantic tier: one FAISS index per conversation prefix,
+        # mapping index positions back to exact cache keys
+        self._indexes = {}
+
+        if semantic_threshold is not None:
+            try:
+                import faiss
+                import numpy
+                import sentence_transformers
+            except ImportError:
+                print(
+                    "⚠️ Semantic cache needs extra packages (pip install sentence-transformers faiss-cpu numpy); "
+                    "serving exact matches only"
+                )
+                self._semantic_threshold = None
+
+    def _payload(self, messages, tools, tool_choice, json_output, extra_create_args):
+        """Collect everything that affects the response into a JSON-friendly dict."""
+        if isinstance(json_output, type):
+            json_output = json_output.__name__
+
+        if isinstance(tool_choice, Tool):
+            tool_choice = tool_choice.name
+
+        return {
+            # Client-level settings (model name, max_tokens, ...)
+            "client_args": getattr(self._inner, "_create_args", {}),
+            "messages": [message.model_dump(mode="json") for message in messages],
+            "tools": [tool.schema if isinstance(tool, Tool) else tool for tool in tools],
+            "tool_choice": tool_choice,
+            "json_output": json_output,
+            "params": extra_create_args,
+        }
+
+    def _lookup(self, key):
+        """Return the cached CreateResult for a key, or None on a miss."""
+        data = self._cache.get(key)
+        if data is None:
+            return None
+
+        result = CreateResult.model_validate(data)
+        result.cached = True
+        return result
+
+    # ------------------------------------------------------------------
+    # Semantic tier
+    # ------------------------------------------------------------------
+
+    def _semantic_prompt(self, messages, payload):
+        """
+        Split a request into (prefix_key, prompt) for the semantic tier.
+
+        Only requests ending in a plain-text user message are eligible. The
+        prefix key covers everything except that message, so a paraphrase only
+        matches prompts sent by the same agent at the same point in a conversation.
+        """
+        if self._semantic_threshold is None or not messages:
+            return None, None
+
+        last = messages[-1]
+        if not isinstance(last, UserMessage) or not isinstance(last.content, str):
+            return None, None
+
+        prefix_key = _hash({**payload, "messages": payload["messages"][:-1]})
+        return prefix_key, last.content
+
+    def _get_index(self, prefix_key):
+        """Return (faiss_index, exact_keys) for a conversation prefix, loading it from disk."""
+        if prefix_key not in self._indexes:
+            import faiss
+            import numpy
+
+            entries = self._cache.get(f"semantic:{prefix_key}", [])
+            dimension = _get_embedder().get_sentence_embedding_dimension()
+            index = faiss.IndexFlatIP(dimension)
+            if entries:
+                index.add(numpy.asarray([embedding for embedding, _ in entries], dtype="float32"))
+
+            self._indexes[prefix_key] = (index, [key for _, key in entries])
+
+        return self._indexes[prefix_key]
+
+    async def _embed(self, prompt):
+        """Embed a prompt as a normalized vector (so inner product = cosine similarity)."""
+        embedder = _get_embedder()
+        embedding = await asyncio.to_thread(embedder.encode, prompt, normalize_embeddings=True)
+        return embedding.astype("float32")
+
+    async def _semantic_lookup(self, prefix_key, embedding):
+        """Return the cached response for the most similar earlier prompt, if close enough."""
+        index, keys = self._get_index(prefix_key)
+        if index.ntotal == 0:
+            return None
+
+        scores, positions = index.search(embedding.reshape(1, -1), 1)
+        if scores[0][0] < self._semantic_threshold:
+            return None
+
+        return self._lookup(keys[positions[0][0]])
+
+    def _semantic_store(self, prefix_key, embedding, key):
+        """Remember a prompt embedding so later paraphrases can find its response."""
+        index, keys = self._get_index(prefix_key)
+        index.add(embedding.reshape(1, -1))
+        keys.append(key)
+
+        entries = self._cache.get(f"semantic:{prefix_key}", [])
+        entries.append((embedding.tolist(), key))
+        self._cache.set(f"semantic:{prefix_key}", entries)
+
+    async def _find_cached(self, messages, tools, tool_choice, json_output, extra_create_args):
+        """
+        Look a request up in both cache tiers.
+
+        Returns:
+            tuple: (cached_result or None, exact_key, prefix_key, embedding)
+        """
+        payload = self._payload(messages, tools, tool_choice, json_output, extra_create_args)
+        key = _hash(payload)
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached, key, None, None
+
+        prefix_key, prompt = self._semantic_prompt(messages, payload)
+        if prefix_key is None:
+            return None, key, None, None
+
+        embedding = await self._embed(prompt)
+        cached = await self._semantic_lookup(prefix_key, embedding)
+        return cached, key, prefix_key, embedding
+
+    def _store(self, result, key, prefix_key, embedding):
+        """Save a fresh response in the exact tier (and the semantic tier if enabled)."""
+        self._cache.set(key, result.model_dump())
+        if prefix_key is not None:
+            self._semantic_store(prefix_key, embedding, key)
+
+    async def create(
+        self,
+        messages,
+        *,
+        tools=[],
+        tool_choice="auto",
+        json_output=None,
+        extra_create_args={},
+        cancellation_token=None,
+    ):
+        cached, key, prefix_key, embedding = await self._find_cached(
+            messages, tools, tool_choice, json_output, extra_create_args
+        )
+        if cached is not None:
+            return cached
+
+        result = await self._inner.create(
+            messages,
+            tools=tools,
+            tool_choice=tool_choice,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        )
+        self._store(result, key, prefix_key, embedding)
+        return result
+
+    async def create_stream(
+        self,
+        messages,
+        *,
+        tools=[],
+        tool_choice="auto",
+        json_output=None,
+        extra_create_args={},
+        cancellation_token=None,
+    ):
+        cached, key, prefix_key, embedding = await self._find_cached(
+            messages, tools, tool_choice, json_output, extra_create_args
+        )
+
+        # On a hit, emit the whole response at once
+        if cached is not None:
+            yield cached
+            return
+
+        async for chunk in self._inner.create_stream(
+            messages,
+            tools=tools,
+            tool_choice=tool_choice,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        ):
+            if isinstance(chunk, CreateResult):
+                self._store(chunk, key, prefix_key, embedding)
+            yield chunk
+
+    async def close(self):
+        """Close the disk cache. The wrapped client is left open since it may be shared."""
+        self._cache.close()
+
+    def actual_usage(self):
+        return self._inner.actual_usage()
+
+    def total_usage(self):
+        return self._inner.total_usage()
+
+    def count_tokens(self, messages, *, tools=[]):
+        return self._inner.count_tokens(messages, tools=tools)
+
+    def remaining_tokens(self, messages, *, tools=[]):
+        return self._inner.remaining_tokens(messages, tools=tools)
+
+    @property
+    def capabilities(self):
+        return self._inner.capabilities
+
+    @property
+    def model_info(self):
+        return self._inner.model_info
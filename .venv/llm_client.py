@@ -0,0 +1,355 @@
+"""
+SHARED GEMINI MODEL CLIENT
+==========================
+Provides a lazily-constructed Gemini chat client that every script and agent
+reuses (one per max_tokens / prefix-cache setting, all sharing one HTTP client).
+The underlying HTTP client keeps its connections
+alive and speaks HTTP/2, so multi-turn conversations don't repeat TLS handshakes
+and DNS lookups, and concurrent agent turns share a single connection.
+
+A stable system message can also be stored server-side as Gemini cached
+content (create_prefix_cache), so later requests skip re-processing that prefix.
+
+REQUIREMENTS:
+- Python packages: autogen-agentchat, autogen-ext, python-dotenv, httpx[http2]
+- Optional (Linux/macOS): uvloop
+- Optional (faster request encoding): orjson
+- Optional (prefix caching): google-genai
+- Optional (response cache, semantic_cache=True): diskcache; sentence-transformers, faiss-cpu, numpy
+
+The .env file, API key and model capabilities are loaded (and the key validated)
+once at import, and the client is closed once when run_async() finishes, not at
+the end of each main().
+"""
+
+import asyncio
+import hashlib
+import os
+from collections import namedtuple
+
+import httpx
+from autogen_core.models import ModelInfo, SystemMessage
+from autogen_ext.models.openai import OpenAIChatCompletionClient
+from dotenv import load_dotenv
+from openai import APIStatusError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Load environment variables from .env file (once, at import)
+# ⚠️ Security: Never hardcode API keys in source code - always use environment variables
+load_dotenv()
+
+# Fail fast at import if the API key is missing, before any event loop or client starts
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+if not GEMINI_API_KEY:
+    raise RuntimeError(
+        "❌ GEMINI_API_KEY not found in environment variables. "
+        "Please add GEMINI_API_KEY=your_key to your .env file"
+    )
+
+GEMINI_MODEL = "gemini-2.0-flash-lite"
+GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"
+
+# Gemini model capabilities (shared by every client)
+MODEL_INFO = ModelInfo(
+    vision=True,
+    function_calling=True,
+    json_output=False,
+    family="unknown",
+    structured_output=True
+)
+
+# Handle to a server-side Gemini cache holding a system message
+# (name: 'cachedContents/...' resource name, system_message: the cached text)
+PrefixCache = namedtuple("PrefixCache", ["name", "system_message"])
+
+# Gemini rejects cached content below a minimum size (4096 tokens for the 2.0 Flash
+# models); shorter prompts are estimated at ~4 characters per token and not sent
+PREFIX_CACHE_MIN_TOKENS = 4096
+_CHARS_PER_TOKEN = 4
+
+# HTTP statuses that mean the cached content itself was rejected (bad or expired cache);
+# other errors (429, 5xx) are raised as usual instead of disabling the cache
+_CACHE_REJECTED_STATUSES = (400, 404)
+
+# Shared HTTP connection pool (created on first use)
+_http_client = None
+
+# Shared model clients, one per (max_tokens, prefix_cache) setting, all on the same pool
+_clients = {}
+
+
+class OrjsonAsyncClient(httpx.AsyncClient):
+    """
+    httpx.AsyncClient that serializes JSON request bodies with orjson.
+
+    Every chat request carries the whole conversation so far, so the body grows
+    with each turn; orjson encodes it several times faster than the stdlib json
+    module httpx uses. Falls back to httpx's own encoding if orjson isn't
+    installed or can't encode a value.
+    """
+
+    def build_request(self, method, url, *, json=None, **kwargs):
+        if json is not None and orjson is not None and kwargs.get("content") is None:
+            try:
+                content = orjson.dumps(json)
+            except TypeError:
+                content = None
+
+            if content is not None:
+                headers = httpx.Headers(kwargs.pop("headers", None))
+                headers.setdefault("Content-Type", "application/json")
+                return super().build_request(method, url, content=content, headers=headers, **kwargs)
+
+        return super().build_request(method, url, json=json, **kwargs)
+
+
+class GeminiChatCompletionClient(OpenAIChatCompletionClient):
+    """
+    OpenAI-compatible Gemini client that can reuse a server-side prefix cache.
+
+    When a PrefixCache is given, the matching system message is left out of
+    each request and Gemini is told to use the cached content instead, so it
+    only processes the new part of the conversation. If the cache is rejected
+    (e.g. it expired), the client falls back to sending the full prompt.
+
+    Args:
+        prefix_cache (PrefixCache, optional): Cache created by create_prefix_cache()
+        **kwargs: Passed through to OpenAIChatCompletionClient
+    """
+
+    def __init__(self, prefix_cache=None, **kwargs):
+        super().__init__(**kwargs)
+        self._prefix_cache = prefix_cache
+
+    def _with_prefix_cache(self, messages, extra_create_args):
+        """Drop the cached system message and point the request at the cached content."""
+        cache = self._prefix_cache
+        messages = [
+            message for message in messages
+            if not (isinstance(message, SystemMessage) and message.content == cache.system_message)
+        ]
+        extra_body = {
+            **extra_create_args.get("extra_body", {}),
+            "extra_body": {"google": {"cached_content": cache.name}}
+        }
+        return messages, {**extra_create_args, "extra_body": extra_body}
+
+    def _disable_prefix_cache(self, error):
+        print(f"⚠️ Gemini prefix cache rejected ({error}); sending full prompts instead")
+        self._prefix_cache = None
+
+    async def create(self, messages, *, extra_create_args={}, **kwargs):
+        if self._prefix_cache is not None:
+            cached_messages, cached_args = self._with_prefix_cache(messages, extra_create_args)
+            try:
+                return await super().create(cached_messages, extra_create_args=cached_args, **kwargs)
+            except APIStatusError as e:
+                if e.status_code not in _CACHE_REJECTED_STATUSES:
+                    raise
+                self._disable_prefix_cache(e)
+
+        return await super().create(messages, extra_create_args=extra_create_args, **kwargs)
+
+    async def create_stream(self, messages, *, extra_create_args={}, **kwargs):
+        if self._prefix_cache is not None:
+            cached_messages, cached_args = self._with_prefix_cache(messages, extra_create_args)
+            try:
+                async for chunk in super().create_stream(
+                    cached_messages, extra_create_args=cached_args, **kwargs
+                ):
+                    yield chunk
+                return
+            except APIStatusError as e:
+                # The request is rejected before any tokens are streamed
+                if e.status_code not in _CACHE_REJECTED_STATUSES:
+                    raise
+                self._disable_prefix_cache(e)
+
+        async for chunk in super().create_stream(messages, extra_create_args=extra_create_args, **kwargs):
+            yield chunk
+
+
+async def create_prefix_cache(system_message, ttl="3600s"):
+    """
+    Store a system message as Gemini cached content for prefix reuse.
+
+    Prompts below Gemini's minimum cacheable size are skipped without a network
+    call. A cache created earlier for the same model and prompt (matched by its
+    display name) is reused, so later runs share it; a new one is only created if
+    none exists. Caches are left to expire after their TTL (not deleted at exit),
+    which is what makes that cross-run reuse possible.
+    Failures are reported and None is returned, and callers simply run without the cache.
+
+    Args:
+        system_message (str): Exact system message text the agent will send
+        ttl (str, optional): How long Gemini keeps the cache. Defaults to one hour.
+
+    Returns:
+        PrefixCache | None: Cache handle, or None if caching isn't available
+    """
+    if len(system_message) < PREFIX_CACHE_MIN_TOKENS * _CHARS_PER_TOKEN:
+        return None
+
+    try:
+        from google import genai
+        from google.genai import types
+    except ImportError:
+        print("⚠️ google-genai not installed; Gemini prefix caching disabled")
+        return None
+
+    digest = hashlib.sha256(f"{GEMINI_MODEL}\n{system_message}".encode()).hexdigest()[:16]
+    display_name = f"prefix-{digest}"
+
+    try:
+        client = genai.Client(api_key=GEMINI_API_KEY)
+
+        async for cache in await client.aio.caches.list():
+            if cache.display_name == display_name:
+                print(f"✓ Reusing Gemini prefix cache: {cache.name}")
+                return PrefixCache(cache.name, system_message)
+
+        cache = await client.aio.caches.create(
+            model=GEMINI_MODEL,
+            config=types.CreateCachedContentConfig(
+                display_name=display_name,
+                system_instruction=system_message,
+                ttl=ttl
+            )
+        )
+    except Exception as e:
+        print(f"⚠️ Gemini prefix cache unavailable ({e}); continuing without it")
+        return None
+
+    print(f"✓ Gemini prefix cache ready: {cache.name}")
+    return PrefixCache(cache.name, system_message)
+
+
+def _get_http_client():
+    """Return the shared httpx.AsyncClient, creating it on first call."""
+    global _http_client
+
+    if _http_client is None:
+        # Keep idle connections open between agent turns, and use HTTP/2 so
+        # concurrent agent requests multiplex over one TLS connection
+        # instead of queueing for HTTP/1.1 connection slots (requires 'h2')
+        # Request bodies are encoded with orjson (see OrjsonAsyncClient)
+        _http_client = OrjsonAsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=300
+            )
+        )
+
+    return _http_client
+
+
+def get_model_client(semantic_cache=False, similarity_threshold=0.95, max_tokens=None, prefix_cache=None,
+                     exact_cache=False):
+    """
+    Return the shared Gemini model client, creating it on first call.
+
+    The client wraps a persistent HTTP/2 httpx.AsyncClient with a keep-alive
+    pool, so every agent that uses it shares the same open connections.
+
+    Args:
+        semantic_cache (bool, optional): If True, wrap the shared client in a
+                                         CachingChatClient that serves exact and
+                                         paraphrased repeat requests from disk.
+        similarity_threshold (float, optional): Cosine similarity needed for a
+                                                semantic cache hit. Defaults to 0.95.
+        max_tokens (int, optional): Cap on generated tokens per response.
+                                    Decoding time grows with output length, so a
+                                    cap bounds both latency and cost.
+                                    If None, the model default is used.
+        prefix_cache (PrefixCache, optional): Server-side cache of the agent's
+                                              system message (see create_prefix_cache).
+        exact_cache (bool, optional): If True (and semantic_cache is False), wrap the
+                                      shared client in a CachingChatClient that only
+                                      serves byte-identical repeat requests from disk.
+
+    Returns:
+        ChatCompletionClient: Shared Gemini model client (cache-wrapped if requested)
+    """
+    client_key = (max_tokens, prefix_cache)
+    client = _clients.get(client_key)
+
+    if client is None:
+        client_args = {}
+        if max_tokens is not None:
+            client_args["max_tokens"] = max_tokens
+
+        client = GeminiChatCompletionClient(
+            prefix_cache=prefix_cache,
+            model=GEMINI_MODEL,
+            model_info=MODEL_INFO,
+            api_key=GEMINI_API_KEY,
+            base_url=GEMINI_BASE_URL,
+            http_client=_get_http_client(),
+            **client_args
+        )
+        _clients[client_key] = client
+
+    if semantic_cache or exact_cache:
+        # Imported here so scripts that don't use the response cache don't need diskcache
+        from llm_cache import CachingChatClient
+        return CachingChatClient(client, semantic_threshold=similarity_threshold if semantic_cache else None)
+
+    return client
+
+
+def run_async(main):
+    """
+    Run a coroutine to completion on the fastest available event loop.
+
+    Uses uvloop (libuv-based, Linux/macOS) when it is installed, which lowers
+    per-await overhead while agents wait on the network. uvloop isn't available
+    on Windows, so there the default asyncio loop is kept; its Proactor loop is
+    also the one that supports the subprocesses MCP stdio servers need.
+
+    The shared connection pool is closed on the same loop before it shuts down,
+    since its connections can't be closed from another event loop.
+
+    Args:
+        main: Coroutine to run, e.g. main()
+
+    Returns:
+        The coroutine's return value
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(_run_and_close(main))
+
+    return uvloop.run(_run_and_close(main))
+
+
+async def _run_and_close(main):
+    """Await main, then close the shared model clients on the still-running loop."""
+    try:
+        return await main
+    finally:
+        await close_model_client()
+
+
+async def close_model_client():
+    """
+    Close the shared connection pool used by every model client.
+
+    Must be awaited on the event loop that made the requests. Later calls to
+    get_model_client() start a fresh pool.
+    """
+    global _http_client
+
+    if _http_client is None:
+        return
+
+    http_client = _http_client
+    _http_client = None
+    _clients.clear()
+    await http_client.aclose()
@@ -0,0 +1,26 @@
+"""
+SHARED AGENT SYSTEM MESSAGES
+============================
+System messages used by more than one script live here, so every script sends
+exactly the same bytes. Identical system prompts produce identical prompt
+prefixes (and cache keys), which lets the provider's prompt cache and the local
+response cache (llm_cache.py) hit across scripts and runs.
+
+CACHE-STABLE PREFIX: don't format per-run data into these strings; put
+per-session text in the task message instead.
+"""
+
+import sys
+import textwrap
+
+# Researcher: gathers and presents factual information
+RESEARCHER_SYS = sys.intern(textwrap.dedent("""\
+    You are a researcher who gathers facts and information.
+    You provide detailed, accurate information on topics.
+    Keep responses concise and factual."""))
+
+# Analyst: critically examines information and identifies patterns
+ANALYST_SYS = sys.intern(textwrap.dedent("""\
+    You are an analyst who examines information critically.
+    You analyze the information provided by others and provide insights.
+    Ask probing questions and identify patterns."""))
@@ -0,0 +1,50 @@
+"""
+MULTI-KEYWORD TERMINATION
+=========================
+A TextMentionTermination that stops a conversation when any one of several
+phrases is mentioned.
+
+All phrases are compiled into a single regular expression up front, so each
+message is scanned once no matter how many phrases are configured (instead
+of one substring search per phrase).
+"""
+
+import re
+
+from autogen_agentchat.base import TerminatedException
+from autogen_agentchat.conditions import TextMentionTermination
+from autogen_agentchat.messages import StopMessage
+
+
+class MultiKeywordTermination(TextMentionTermination):
+    """
+    Terminate the conversation when any of the given keywords is mentioned.
+
+    Args:
+        keywords (list[str]): Phrases that end the conversation
+        sources (list[str], optional): Only check messages from these agents.
+                                       If None, every message is checked.
+    """
+
+    def __init__(self, keywords, sources=None):
+        super().__init__(keywords[0], sources=sources)
+        self._keywords = list(keywords)
+        self._pattern = re.compile("|".join(re.escape(keyword) for keyword in self._keywords))
+
+    async def __call__(self, messages):
+        if self._terminated:
+            raise TerminatedException("Termination condition has already been reached")
+
+        for message in messages:
+            if self._sources is not None and message.source not in self._sources:
+                continue
+
+            match = self._pattern.search(message.to_text())
+            if match:
+                self._terminated = True
+                return StopMessage(
+                    content=f"Text '{match.group(0)}' mentioned",
+                    source="MultiKeywordTermination"
+                )
+
+        return None
@@ -0,0 +1,122 @@
+"""
+Async Loop Thread Module
+========================
+Runs MCP (Model Context Protocol) clients on one dedicated event loop thread,
+shared by every agent.
+
+The MCP sessions (their stdio readers and message handling) then live on
+their own loop, so tool calls from several agents can overlap without
+waiting on the agents' event loop, and a busy agent loop doesn't delay the
+MCP traffic of the others.
+"""
+
+import asyncio
+import functools
+import threading
+
+from autogen_core.tools import Workbench
+
+
+class AsyncLoopThread:
+    """
+    An asyncio event loop running forever on a background (daemon) thread.
+
+    Args:
+        name (str, optional): Thread name. Defaults to 'mcp-loop'.
+    """
+
+    def __init__(self, name="mcp-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def start(self):
+        """Start the loop thread (no-op if it is already running)."""
+        if not self._thread.is_alive():
+            self._thread.start()
+        return self
+
+    async def run(self, coro):
+        """
+        Run a coroutine on the loop thread and await its result from the current loop.
+
+        The calling loop is not blocked while waiting, and cancelling the
+        caller also cancels the coroutine on the loop thread.
+
+        Args:
+            coro (Coroutine): Coroutine to run on the loop thread
+
+        Returns:
+            The coroutine's result
+        """
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    def stop(self):
+        """Stop the loop and wait for the thread to exit."""
+        if self._thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        self.loop.close()
+
+
+@functools.cache
+def get_loop_thread():
+    """
+    Return the process-wide MCP loop thread, starting it on first call.
+
+    Returns:
+        AsyncLoopThread: The shared, running loop thread
+    """
+    return AsyncLoopThread().start()
+
+
+class MCPClientWrapper(Workbench):
+    """
+    Workbench that forwards every call to an MCP workbench living on a loop thread.
+
+    Agents use it like any other workbench; the wrapped workbench must be
+    started (and stopped) on the same loop thread.
+
+    Args:
+        workbench (McpWorkbench): Workbench running on the loop thread
+        loop_thread (AsyncLoopThread): Loop thread that owns the workbench
+    """
+
+    def __init__(self, workbench, loop_thread):
+        self._workbench = workbench
+        self._loop_thread = loop_thread
+
+    async def list_tools(self):
+        return await self._loop_thread.run(self._workbench.list_tools())
+
+    async def call_tool(self, name, arguments=None, cancellation_token=None, call_id=None):
+        # call_id is only passed on when set (older autogen versions don't accept it)
+        kwargs = {} if call_id is None else {"call_id": call_id}
+        future = asyncio.ensure_future(
+            self._loop_thread.run(self._workbench.call_tool(name, arguments, **kwargs))
+        )
+
+        # The cancellation token belongs to the caller's loop, so it is linked here
+        # rather than handed to the loop thread
+        if cancellation_token is not None:
+            cancellation_token.link_future(future)
+
+        return await future
+
+    async def start(self):
+        await self._loop_thread.run(self._workbench.start())
+
+    async def stop(self):
+        await self._loop_thread.run(self._workbench.stop())
+
+    async def reset(self):
+        await self._loop_thread.run(self._workbench.reset())
+
+    async def save_state(self):
+        return await self._loop_thread.run(self._workbench.save_state())
+
+    async def load_state(self, state):
+        await self._loop_thread.run(self._workbench.load_state(state))
@@ -0,0 +1,72 @@
+"""
+Cached Workbench Module
+=======================
+Wraps an MCP (Model Context Protocol) workbench so its tool list is fetched
+from the server only once.
+
+An AssistantAgent asks its workbench for the tool list before every model
+call; with a plain McpWorkbench each of those is a round trip to the MCP
+server. The tools a server offers don't change while it runs, so the list
+is cached and reused until the workbench is reset or stopped.
+"""
+
+from autogen_core.tools import TextResultContent, ToolResult, Workbench
+
+
+class CachedWorkbench(Workbench):
+    """
+    Workbench that caches the wrapped workbench's tool list and tool index.
+
+    Calls to tools that the server doesn't offer fail fast with an error
+    result, without a round trip to the server.
+
+    Args:
+        workbench (McpWorkbench): The workbench that talks to the MCP server
+    """
+
+    def __init__(self, workbench):
+        self._workbench = workbench
+        self._tools = None
+        self._tool_index: dict = {}
+
+    async def list_tools(self):
+        if self._tools is None:
+            self._tools = list(await self._workbench.list_tools())
+            self._tool_index = {tool["name"]: tool for tool in self._tools}
+        return self._tools
+
+    async def call_tool(self, name, arguments=None, cancellation_token=None, call_id=None):
+        # Only known tools are sent to the server (once the tool list has been fetched)
+        if self._tools is not None and name not in self._tool_index:
+            return ToolResult(
+                name=name,
+                result=[TextResultContent(content=f"Unknown tool '{name}'. Available tools: {list(self._tool_index)}")],
+                is_error=True
+            )
+
+        # call_id is only passed on when set (older autogen versions don't accept it)
+        kwargs = {} if call_id is None else {"call_id": call_id}
+        return await self._workbench.call_tool(name, arguments, cancellation_token, **kwargs)
+
+    def _clear_tools(self):
+        """Forget the cached tool list (the server may offer different tools after a restart)."""
+        self._tools = None
+        self._tool_index = {}
+
+    async def start(self):
+        self._clear_tools()
+        await self._workbench.start()
+
+    async def stop(self):
+        self._clear_tools()
+        await self._workbench.stop()
+
+    async def reset(self):
+        self._clear_tools()
+        await self._workbench.reset()
+
+    async def save_state(self):
+        return await self._workbench.save_state()
+
+    async def load_state(self, state):
+        await self._workbench.load_state(state)
@@ -5,6 +5,8 @@ Provides configuration for different MCP (Model Context Protocol) servers
 including MySQL database and file system access.
 """
 
+import functools
+import logging
 import os
 import sys
 import shutil
@@ -13,8 +15,171 @@ from pathlib import Path
 from autogen_ext.tools.mcp import StdioServerParams, McpWorkbench
 from dotenv import load_dotenv
 
+from Factory.CachedWorkbench import CachedWorkbench
+
+# Diagnostics are logged lazily (%-style); use e.g. logging.basicConfig(level=logging.INFO)
+# to see which paths and servers are used
+logger = logging.getLogger(__name__)
+
+@functools.cache
+def _load_env_once():
+    """Load the .env file the first time it is called; later calls are no-ops."""
+    load_dotenv()
+
+
 # Load environment variables
-load_dotenv()
+_load_env_once()
+
+
+# Default file system MCP directory: this module's directory, resolved once
+_DEFAULT_FS_DIR = Path(__file__).parent.resolve().as_posix()
+
+
+# Absolute paths of the Node.js commands, resolved once at import
+# (falls back to the bare name, leaving the lookup to the OS, if it isn't on PATH)
+_NPX = shutil.which("npx") or "npx"
+_NODE = shutil.which("node") or "node"
+
+
+# Where to look for 'uv', in order (platform-specific fallback next to the Python executable)
+_UV_CANDIDATES = [
+    "uv",
+    str(Path(sys.executable).parent / ("Scripts" if sys.platform == "win32" else "bin") / "uv"),
+]
+
+
+@functools.cache
+def _resolve_uv_path():
+    """
+    Find the 'uv' command, once per process.
+
+    Returns:
+        str: Path to the 'uv' executable
+
+    Raises:
+        FileNotFoundError: If 'uv' command cannot be found
+    """
+    # Find uv on PATH first, then relative to the Python installation;
+    # shutil.which also checks absolute paths (and adds .exe via PATHEXT on Windows)
+    for candidate in _UV_CANDIDATES:
+        uv_path = shutil.which(candidate)
+        if uv_path:
+            logger.info("Using uv: %s", uv_path)
+            return uv_path
+
+    raise FileNotFoundError(
+        "❌ 'uv' command not found. Please install it: pip install uv"
+    )
+
+
+@functools.cache
+def _site_packages():
+    """
+    Find the site-packages directory (with forward slashes), once per process.
+
+    Returns:
+        str: site-packages directory path
+    """
+    site_packages = site.getsitepackages()[0]
+    site_packages_str = Path(site_packages).as_posix()
+
+    logger.info("Using site-packages: %s", site_packages_str)
+    return site_packages_str
+
+
+@functools.cache
+def _mysql_env():
+    """
+    Read the MySQL settings from the environment once, with defaults applied.
+
+    Call clear_env_cache() after changing MYSQL_* variables at runtime.
+
+    Returns:
+        dict: MYSQL_* environment for the MySQL MCP server
+    """
+    return {
+        "MYSQL_HOST": os.getenv("MYSQL_HOST", "localhost"),
+        "MYSQL_PORT": os.getenv("MYSQL_PORT", "3306"),
+        "MYSQL_USER": os.getenv("MYSQL_USER", "root"),
+        "MYSQL_PASSWORD": os.getenv("MYSQL_PASSWORD", "1234"),
+        "MYSQL_DATABASE": os.getenv("MYSQL_DATABASE", "school_db")
+    }
+
+
+def clear_env_cache():
+    """Forget the cached environment snapshot (and the server parameters built from it)."""
+    _mysql_env.cache_clear()
+    _mysql_server_params.cache_clear()
+
+
+@functools.cache
+def _mysql_server_params():
+    """
+    Build the MySQL MCP server parameters once; they are reused by every workbench.
+
+    Returns:
+        StdioServerParams: MySQL MCP server parameters
+
+    Raises:
+        FileNotFoundError: If 'uv' command cannot be found
+        ValueError: If required environment variables are missing
+    """
+    uv_path = _resolve_uv_path()
+    site_packages_str = _site_packages()
+
+    #  Load MySQL configuration from the cached environment snapshot
+    mysql_config = _mysql_env()
+
+    # Validate that critical configuration exists
+    if not mysql_config["MYSQL_DATABASE"]:
+        raise ValueError("❌ MYSQL_DATABASE environment variable is required")
+
+    # Configure MySQL MCP server parameters
+    return StdioServerParams(
+        command=uv_path,  # ✅ Dynamic path
+        args=[
+            "--directory",
+            site_packages_str,  # ✅ Dynamic path
+            "run",
+            "mysql_mcp_server"
+        ],
+        env=mysql_config,
+        read_timeout_seconds=60
+    )
+
+
+@functools.cache
+def _filesystem_server_params(directory_str):
+    """Build (once per directory) the file system MCP server parameters."""
+    return StdioServerParams(
+        command=_NPX,
+        args=[
+            "-y",
+            "@modelcontextprotocol/server-filesystem",
+            directory_str
+        ],
+        read_timeout_seconds=60
+    )
+
+
+@functools.cache
+def _rest_server_params(env_items):
+    """
+    Build (once per distinct environment) the REST API MCP server parameters.
+
+    Args:
+        env_items (tuple): Sorted (name, value) pairs for the server environment
+    """
+    return StdioServerParams(
+        # NOTE: Assuming the dkmaker-mcp-rest-api is globally installed for the user
+        #       running the script, similar to how the 'npx' command is used.
+        command=_NODE,
+        args=[
+            "PATH TO -> /dkmaker-mcp-rest-api/build/index.js" # Change to your local path
+        ],
+        env=dict(env_items),
+        read_timeout_seconds=60
+    )
 
 
 class MCPConfig:
@@ -31,74 +196,24 @@ class MCPConfig:
 
         Uses dynamic path resolution to find the 'uv' command and site-packages directory.
         Database credentials are loaded from environment variables for security.
+        The resolved server parameters are cached, so repeated calls only create
+        a new workbench.
 
         Returns:
-            McpWorkbench: Configured MySQL MCP workbench
+            CachedWorkbench: Configured MySQL MCP workbench (tool list cached)
 
         Raises:
             FileNotFoundError: If 'uv' command cannot be found
             ValueError: If required environment variables are missing
         """
 
-        # Find uv command dynamically
-        uv_path = shutil.which("uv")
-
-        # If not in PATH, try to find it relative to Python installation
-        if not uv_path:
-            python_dir = Path(sys.executable).parent
-            possible_locations = [
-                python_dir / "Scripts" / "uv.exe",  # Windows
-                python_dir / "Scripts" / "uv",  # Windows (no .exe)
-                python_dir / "bin" / "uv",  # Linux/Mac
-            ]
-
-            for location in possible_locations:
-                if location.exists():
-                    uv_path = str(location)
-                    break
-
-        if not uv_path:
-            raise FileNotFoundError(
-                "❌ 'uv' command not found. Please install it: pip install uv"
-            )
-
-
-        site_packages = site.getsitepackages()[0]
-        site_packages_str = str(Path(site_packages)).replace("\\", "/")
-
-        print(f"✓ Using uv: {uv_path}")
-        print(f"✓ Using site-packages: {site_packages_str}")
-
-        #  Load MySQL configuration from environment variables
-        mysql_config = {
-            "MYSQL_HOST": os.getenv("MYSQL_HOST", "localhost"),
-            "MYSQL_PORT": os.getenv("MYSQL_PORT", "3306"),
-            "MYSQL_USER": os.getenv("MYSQL_USER", "root"),
-            "MYSQL_PASSWORD": os.getenv("MYSQL_PASSWORD", "1234"),
-            "MYSQL_DATABASE": os.getenv("MYSQL_DATABASE", "school_db")
-        }
+        # Server parameters (uv path, site-packages, credentials) are resolved once and cached
+        mysql_server_params = _mysql_server_params()
 
-        # Validate that critical configuration exists
-        if not mysql_config["MYSQL_DATABASE"]:
-            raise ValueError("❌ MYSQL_DATABASE environment variable is required")
-
-        print(f"📊 Connecting to database: {mysql_config['MYSQL_DATABASE']}\n")
-
-        # Configure MySQL MCP server parameters
-        mysql_server_params = StdioServerParams(
-            command=uv_path,  # ✅ Dynamic path
-            args=[
-                "--directory",
-                site_packages_str,  # ✅ Dynamic path
-                "run",
-                "mysql_mcp_server"
-            ],
-            env=mysql_config,
-            read_timeout_seconds=60
-        )
+        logger.info("Connecting to database: %s", mysql_server_params.env["MYSQL_DATABASE"])
 
         # Create and return the MCP workbench
-        mysql_workbench = McpWorkbench(mysql_server_params)
+        mysql_workbench = CachedWorkbench(McpWorkbench(mysql_server_params))
         return mysql_workbench
 
     @staticmethod
@@ -112,29 +227,18 @@ class MCPConfig:
                                       If None, uses the current script's directory.
 
         Returns:
-            McpWorkbench: Configured file system MCP workbench
+            CachedWorkbench: Configured file system MCP workbench (tool list cached)
         """
-        # ✅ Use provided directory or default to script's directory
-        if directory is None:
-            directory = Path(__file__).parent.resolve()
-
-        directory_str = str(Path(directory)).replace("\\", "/")
+        # ✅ Use provided directory or default to script's directory (resolved once at import)
+        directory_str = _DEFAULT_FS_DIR if directory is None else Path(directory).as_posix()
 
-        print(f"📁 File system access granted to: {directory_str}\n")
+        logger.info("File system access granted to: %s", directory_str)
 
-        # Configure file system MCP server parameters
-        file_server_params = StdioServerParams(
-            command="npx",
-            args=[
-                "-y",
-                "@modelcontextprotocol/server-filesystem",
-                directory_str
-            ],
-            read_timeout_seconds=60
-        )
+        # Configure file system MCP server parameters (cached per directory)
+        file_server_params = _filesystem_server_params(directory_str)
 
         # Create and return the MCP workbench
-        file_workbench = McpWorkbench(file_server_params)
+        file_workbench = CachedWorkbench(McpWorkbench(file_server_params))
         return file_workbench
 
     @staticmethod
@@ -151,7 +255,7 @@ class MCPConfig:
             **env_vars: Additional environment variables to pass (e.g., for headers like Authorization).
 
         Returns:
-            McpWorkbench: Configured REST API MCP workbench
+            CachedWorkbench: Configured REST API MCP workbench (tool list cached)
         """
         # 1. Define Defaults
         default_base_url = "https://fake-json-api.mock.beeceptor.com/users"
@@ -161,7 +265,7 @@ class MCPConfig:
         rest_base_url = base_url if base_url is not None else default_base_url
         header_accept = accept_header if accept_header is not None else default_accept
 
-        print(f"🔗 REST API access configured for: {rest_base_url}\n")
+        logger.info("REST API access configured for: %s", rest_base_url)
 
         # 3. Build Environment Variables (env)
         env = {
@@ -170,20 +274,11 @@ class MCPConfig:
             **env_vars  # Include any additional headers/env vars passed in
         }
 
-        # 4. Configure REST API MCP server parameters
-        rest_server_params = StdioServerParams(
-            # NOTE: Assuming the dkmaker-mcp-rest-api is globally installed for the user
-            #       running the script, similar to how the 'npx' command is used.
-            command="node",
-            args=[
-                "PATH TO -> /dkmaker-mcp-rest-api/build/index.js" # Change to your local path
-            ],
-            env=env,
-            read_timeout_seconds=60
-        )
+        # 4. Configure REST API MCP server parameters (cached per distinct environment)
+        rest_server_params = _rest_server_params(tuple(sorted(env.items())))
 
         # 5. Create and return the MCP workbench
-        rest_workbench = McpWorkbench(rest_server_params)
+        rest_workbench = CachedWorkbench(McpWorkbench(rest_server_params))
         return rest_workbench
 
     @staticmethod
@@ -0,0 +1,170 @@
+"""
+MCP Host Module
+===============
+Keeps a set of MCP (Model Context Protocol) servers connected for the lifetime
+of an application, so agents can share the same running servers across runs
+instead of spawning a new server process per conversation.
+"""
+
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+
+from Factory.AsyncLoopThread import MCPClientWrapper
+
+# Per-server startup events are logged lazily (%-style)
+logger = logging.getLogger(__name__)
+
+# Maximum time to wait for a single MCP server to start
+MCP_STARTUP_TIMEOUT_SECONDS = 30
+
+# Maximum time to wait for a server that failed to start to shut down again
+MCP_STOP_TIMEOUT_SECONDS = 5
+
+
+class MCPHost:
+    """
+    Owns a group of MCP workbenches and their server processes.
+
+    All servers are started concurrently on one shared AsyncExitStack when the
+    host starts, and all of them are stopped together when it closes. Agents get
+    the running workbenches by name through workbench().
+
+    Usage:
+        async with MCPHost({"mysql": MCPConfig.get_MySQL_ServerMCP}) as host:
+            agent = AssistantAgent(..., workbench=host.workbench("mysql"))
+
+    With a loop thread, the servers are started on that thread's event loop and
+    agents get MCPClientWrapper workbenches that forward their calls to it.
+
+    Args:
+        workbenches (dict): Server name -> McpWorkbench (not yet started), or a
+                            callable that builds one. Callables are only called
+                            during start(), so errors while configuring a server
+                            (e.g. a missing command) are isolated like startup errors.
+        timeout (float, optional): Per-server startup timeout in seconds
+        loop_thread (AsyncLoopThread, optional): Loop thread to run the MCP clients on
+                                                 (e.g. get_loop_thread()). If None,
+                                                 they run on the caller's event loop.
+        required (Iterable[str], optional): Servers the application can't run without.
+                                            If one of them fails, startup is aborted;
+                                            any other server that fails is skipped.
+                                            If None, every server is required.
+    """
+
+    def __init__(self, workbenches, timeout=MCP_STARTUP_TIMEOUT_SECONDS, loop_thread=None, required=None):
+        self._workbenches = dict(workbenches)
+        self._timeout = timeout
+        self._loop_thread = loop_thread
+        self._required = frozenset(self._workbenches if required is None else required)
+        self._exit_stack = AsyncExitStack()
+        self.sessions: dict = {}
+        self.failures: dict = {}
+
+    async def start(self):
+        """
+        Start every MCP server concurrently.
+
+        Each server gets its own timeout, so a hung server can't hold up the others.
+        A failing optional server is recorded in self.failures and skipped; if a
+        required server fails, the ones that did start are stopped again.
+
+        Raises:
+            Exception: The first required server's startup error, after every
+                       failure has been reported
+        """
+        names = list(self._workbenches)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(self._connect(spec), timeout=self._timeout)
+                for spec in self._workbenches.values()
+            ),
+            return_exceptions=True
+        )
+
+        errors = []
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.error("child_error: MCP server '%s' failed to start: %r", name, result, exc_info=result)
+                self.failures[name] = result
+                if name in self._required:
+                    errors.append(result)
+            else:
+                logger.info("child_started: MCP server '%s' started", name)
+                self.sessions[name] = result
+
+        if errors:
+            await self.close()
+            raise errors[0]
+
+        return self
+
+    async def _connect(self, spec):
+        """
+        Build and start one workbench and register it for shutdown; return what agents should use.
+
+        McpWorkbench.start() only schedules the server in the background, so the
+        tool list is fetched here as well: that waits for the process to spawn and
+        the MCP handshake to finish (and warms a CachedWorkbench's tool list), so
+        the servers really start in parallel and within the timeout.
+        A server that fails (or times out) here is stopped again right away.
+        """
+        workbench = spec() if callable(spec) else spec
+
+        if self._loop_thread is not None:
+            workbench = MCPClientWrapper(workbench, self._loop_thread)
+
+        await workbench.start()
+        try:
+            await workbench.list_tools()
+        except BaseException:
+            await self._stop_failed(workbench)
+            raise
+
+        self._exit_stack.push_async_callback(workbench.stop)
+        return workbench
+
+    @staticmethod
+    async def _stop_failed(workbench):
+        """Stop a workbench whose server failed to start, without masking the original error."""
+        try:
+            await asyncio.wait_for(workbench.stop(), timeout=MCP_STOP_TIMEOUT_SECONDS)
+        except Exception:
+            logger.warning("Could not stop MCP workbench after a failed start", exc_info=True)
+
+    def is_running(self, name):
+        """Return True if the named server started successfully."""
+        return name in self.sessions
+
+    def workbench(self, name):
+        """
+        Return the running workbench for a server.
+
+        Args:
+            name (str): Server name given when the host was created
+
+        Returns:
+            Workbench: The started workbench (an MCPClientWrapper when using a loop thread)
+
+        Raises:
+            KeyError: If no running server has that name
+        """
+        try:
+            return self.sessions[name]
+        except KeyError:
+            raise KeyError(f"❌ MCP server '{name}' is not running (available: {list(self.sessions)})")
+
+    async def close(self):
+        """Stop every running MCP server."""
+        try:
+            await self._exit_stack.aclose()
+        finally:
+            self.sessions.clear()
+            self.failures.clear()
+            self._exit_stack = AsyncExitStack()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -1,137 +1,370 @@
 
 import asyncio
+import functools
+import logging
 import os
+import weakref
+from contextlib import AsyncExitStack
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.teams import RoundRobinGroupChat
-from autogen_agentchat.conditions import TextMentionTermination  # NEW IMPORT
+from autogen_agentchat.conditions import TextMentionTermination
 from autogen_agentchat.ui import Console
 # ------------------------------
+from autogen_core import CancellationToken
 from autogen_core.models import ModelInfo
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 
+from Factory.AsyncLoopThread import get_loop_thread
 from Factory.Config import MCPConfig
+from Factory.MCPHost import MCPHost
 
+# Diagnostics are logged lazily (%-style)
+logger = logging.getLogger(__name__)
 
-async def main_with_round_robin_chat():
+
+@functools.cache
+def _gemini_api_key():
+    """Read GEMINI_API_KEY from the environment once (call _gemini_api_key.cache_clear() to re-read)."""
+    return os.getenv("GEMINI_API_KEY")
+
+
+# Gemini model capabilities, shared by every client
+_MODEL_INFO = ModelInfo(
+    vision=True,
+    function_calling=True,
+    json_output=False,
+    family="unknown",
+    structured_output=True
+)
+
+# Pipeline agents per MCP host, with the host sessions they were built for
+# (rebuilt when the host restarts; dropped when the host is garbage collected)
+_AGENTS = weakref.WeakKeyDictionary()
+
+
+# Shared Gemini model clients, one per API key (see _get_model_client())
+_MODEL_CLIENTS = {}
+
+
+def _get_model_client(api_key):
+    """
+    Create the Gemini model client once per API key.
+
+    The client (and its HTTP connection pool) is reused by every agent and every
+    run on the same event loop, until close_model_clients() is awaited.
+
+    Args:
+        api_key (str): Gemini API key
+
+    Returns:
+        OpenAIChatCompletionClient: Shared model client
+    """
+    client = _MODEL_CLIENTS.get(api_key)
+    if client is None:
+        client = _MODEL_CLIENTS[api_key] = OpenAIChatCompletionClient(
+            model="gemini-2.0-flash-lite",
+            model_info=_MODEL_INFO,
+            api_key=api_key,
+            base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+        )
+    return client
+
+
+async def close_model_clients():
+    """
+    Close the shared model clients and forget the agents that use them.
+
+    Must be awaited on the event loop that ran the pipeline, before it shuts down,
+    since the clients' connections can't be closed from another event loop.
+    Later runs create fresh clients and agents.
+    """
+    clients = list(_MODEL_CLIENTS.values())
+    _MODEL_CLIENTS.clear()
+    _AGENTS.clear()
+
+    for client in clients:
+        await client.close()
+
+
+def _build_agents(host, model):
+    """
+    Create the pipeline agents, bound to the host's running workbenches.
+
+    Args:
+        host (MCPHost): Started host with the 'rest' server (and 'mysql' / 'files' if they started)
+        model (ChatCompletionClient): Model client shared by the agents
+
+    Returns:
+        tuple: (rest_agent, db_agent, file_agent); db_agent / file_agent are None
+               if their MCP server isn't running
+    """
+    # ============================================
+    # AGENT 1: REST API Agent (EXTRACT)
+    # ============================================
+    rest_agent = AssistantAgent(
+        name="RestApiAgent",
+        model_client=model,
+        workbench=host.workbench("rest"),
+        system_message="""You are an API integration expert.
+        Your first and only task is to use the rest:get tool to retrieve 10 users data from the configured API endpoint.
+        Provide the raw JSON response. The data will be passed to the DatabaseAgent and the FileAgent."""
+    )
+
+    # ============================================
+    # AGENT 2: Database Agent (TRANSFORM & LOAD)
+    # ============================================
+    db_agent = None if not host.is_running("mysql") else AssistantAgent(
+        name="DatabaseAgent",
+        model_client=model,
+        workbench=host.workbench("mysql"),
+        system_message="""You are a database expert. 
+        Your task is to receive the user data from the RestApiAgent.
+        1. Create a table named 'users' in the database with the same structure as obtained from the RestApiAgent json.body
+        2. Insert all the received rows at once: construct a single bulk INSERT statement
+           (INSERT INTO users (...) VALUES (...), (...), ...) covering every row, always increasing the id by 1,
+           and execute it once with the execute_sql tool. Never insert rows one by one.
+        3. After insertion, query all user records and reply with a short summary of what was stored.
+        After the summary, you MUST output the phrase 'DB_DONE' to end your task."""
+    )
+
+    # ============================================
+    # AGENT 3: File System Agent (OUTPUT & TERMINATION)
+    # ============================================
+    file_agent = None if not host.is_running("files") else AssistantAgent(
+        name="FileAgent",
+        model_client=model,
+        workbench=host.workbench("files"),
+        # --- CHANGE HERE: ADD EXPLICIT TERMINATION PHRASE ---
+        system_message="""You are a file system expert.
+        Your final task is to take the user data from the RestApiAgent and format it as a clean text report.
+        Save this report to a file named 'round_robin_report.txt' using the filesystem:write_file tool.
+        After successfully confirming the file was created, you MUST output the phrase 'TERMINATE_CHAT' to end the conversation."""
+    )
+
+    return rest_agent, db_agent, file_agent
+
+
+async def _get_agents(host, api_key):
+    """
+    Return the pipeline agents for a host, building them on first use.
+
+    Later runs on the same host reuse the agents; their conversation history
+    is cleared first, so every run starts fresh. If the host was restarted
+    since (new workbenches, possibly a different set of running servers),
+    the agents are rebuilt for its current sessions.
+
+    Args:
+        host (MCPHost): Started host with the 'rest' server (and 'mysql' / 'files' if they started)
+        api_key (str): Gemini API key
+
+    Returns:
+        tuple: (rest_agent, db_agent, file_agent); db_agent / file_agent may be None
+    """
+    sessions = dict(host.sessions)
+    cached = _AGENTS.get(host)
+
+    if cached is None or cached[0] != sessions:
+        agents = _build_agents(host, _get_model_client(api_key))
+        _AGENTS[host] = (sessions, agents)
+    else:
+        agents = cached[1]
+        await asyncio.gather(*(agent.on_reset(CancellationToken()) for agent in agents if agent is not None))
+
+    return agents
+
+
+# Turn limits for the two parallel branches, so neither can loop forever
+DB_BRANCH_MAX_TURNS = 5
+FILE_BRANCH_MAX_TURNS = 3
+
+
+def create_host(loop_thread=None):
+    """
+    Create (but don't start) the MCP host for the pipeline's three servers.
+
+    Only the REST server is required: without it there is no data to load,
+    while a failed MySQL or file system server just skips its branch.
+    The workbenches are built by the host during startup, so configuration
+    errors (e.g. 'uv' missing for MySQL) are isolated per server as well.
+
+    Args:
+        loop_thread (AsyncLoopThread, optional): Loop thread to run the MCP clients on,
+                                                 shared by all agents (e.g. get_loop_thread())
+
+    Returns:
+        MCPHost: Host with the 'rest', 'mysql' and 'files' servers
+    """
+    return MCPHost({
+        "rest": MCPConfig.get_RestApi_ServerMCP,
+        "mysql": MCPConfig.get_MySQL_ServerMCP,
+        "files": MCPConfig.get_FileSystem_ServerMCP
+    }, loop_thread=loop_thread, required=("rest",))
+
+
+async def run_branch(agent, task, max_turns, termination_condition=None):
+    """
+    Run one agent on its own as a single-participant team.
+
+    The branch runs without console output, since parallel branches would
+    interleave their messages; show the result afterwards with show_branch().
+
+    Args:
+        agent (AssistantAgent): Agent for this branch
+        task: Message(s) the branch starts from
+        max_turns (int): Maximum number of agent turns
+        termination_condition (TerminationCondition, optional): Extra stop condition
+
+    Returns:
+        TaskResult: Messages produced by the branch
+    """
+    team = RoundRobinGroupChat(
+        participants=[agent],
+        termination_condition=termination_condition,
+        max_turns=max_turns
+    )
+    return await team.run(task=task)
+
+
+async def _branch_messages(result, source):
+    """Yield a finished branch's own messages, then its TaskResult (the shape Console expects)."""
+    for message in result.messages:
+        if message.source == source:
+            yield message
+    yield result
+
+
+async def show_branch(agent, result):
+    """
+    Print a finished branch's messages to the console in one block.
+
+    Args:
+        agent (AssistantAgent): Agent that ran the branch
+        result (TaskResult): Result returned by run_branch()
     """
-    Implements a Sequential Task Pipeline using RoundRobinGroupChat:
-    1. RestApiAgent (Extract)
-    2. DatabaseAgent (Transform & Load to DB)
-    3. FileAgent (Load to File)
+    print(f"\n📋 {agent.name} branch")
+    print("=" * 60)
+    await Console(_branch_messages(result, agent.name))
+
+
+async def main_with_round_robin_chat(host=None):
+    """
+    Implements the data pipeline as a small DAG: REST -> (DB || File)
+    1. RestApiAgent (Extract) runs alone
+    2. DatabaseAgent (Transform & Load to DB) and FileAgent (Load to File)
+       then run concurrently, both starting from the RestApiAgent's output
+
+    The DB and File stages don't depend on each other, so running them side by
+    side takes as long as the slower one instead of the sum of both.
+    The DB branch explicitly terminates when the DatabaseAgent outputs the phrase
+    'DB_DONE' and the File branch when the FileAgent outputs 'TERMINATE_CHAT';
+    both branches are also capped by a turn limit.
+    If the MySQL or file system server failed to start, its branch is skipped;
+    if the REST server failed, the pipeline is aborted.
+    The model client and agents are built once and reused; only the termination
+    conditions and the teams are created per run.
 
-    The chat explicitly terminates when the FileAgent outputs the phrase 'TERMINATE_CHAT'.
+    Args:
+        host (MCPHost, optional): Already started host to run on, so a long-running
+                                  application can reuse the same MCP servers across runs.
+                                  If None, a host is started for this run (with its MCP clients on
+                                  the shared loop thread) and stopped afterwards.
     """
-    print("🤖 Starting Round-Robin Chat System (REST -> DB -> File)\n")
+    print("🤖 Starting Data Pipeline (REST -> DB || File)\n")
     print("=" * 60)
 
-    gkey = os.getenv("GEMINI_API_KEY")
+    gkey = _gemini_api_key()
     if not gkey:
-        print("❌ Error: GEMINI_API_KEY not found. Please set the GEMINI_API_KEY environment variable.")
+        logger.error("GEMINI_API_KEY not found. Please set the GEMINI_API_KEY environment variable.")
         return
 
     try:
-        # ✅ Get all three workbenches
-        rest_wb = MCPConfig.get_RestApi_ServerMCP()
-        mysql_wb = MCPConfig.get_MySQL_ServerMCP()
-        file_wb = MCPConfig.get_FileSystem_ServerMCP()
-        model_info = ModelInfo(
-            vision=True,
-            function_calling=True,
-            json_output=False,
-            family="unknown",
-            structured_output=True
-        )
-        # Use an async context manager for all three
-        async with rest_wb as rest, mysql_wb as mysql, file_wb as files:
-
+        # Start all three MCP servers concurrently (each spawns a subprocess and
+        # performs the initialize handshake), unless the caller passed a running host
+        # The MCP clients run on the shared loop thread, so the parallel DB and File
+        # branches' tool calls don't wait on each other's MCP traffic
+        async with AsyncExitStack() as stack:
+            if host is None:
+                host = await stack.enter_async_context(create_host(loop_thread=get_loop_thread()))
 
-            model = OpenAIChatCompletionClient(
-                model="gemini-2.0-flash-lite",
-                model_info=model_info,
-                api_key=gkey,
-                base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
-            )
+            rest_agent, db_agent, file_agent = await _get_agents(host, gkey)
 
             # ============================================
-            # AGENT 1: REST API Agent (EXTRACT)
+            # STAGE 1: EXTRACT (RestApiAgent alone)
             # ============================================
-            rest_agent = AssistantAgent(
-                name="RestApiAgent",
-                model_client=model,
-                workbench=rest,
-                system_message="""You are an API integration expert.
-                Your first and only task is to use the rest:get tool to retrieve 10 users data from the configured API endpoint.
-                Provide the raw JSON response. The data will be passed to the next agent."""
-            )
+            initial_task = "Begin the data pipeline: Extract user data using the rest:get tool."
 
-            # ============================================
-            # AGENT 2: Database Agent (TRANSFORM & LOAD)
-            # ============================================
-            db_agent = AssistantAgent(
-                name="DatabaseAgent",
-                model_client=model,
-                workbench=mysql,
-                system_message="""You are a database expert. 
-                Your task is to receive the data from the previous agent.
-                1. Create a table named 'users' in the database with the same structure as obtained from the previous agent json.body
-                1. Insert the data that is received in the table you created always increase the id by 1.
-                2. After insertion, query all student records and format the results as a clean text report.
-                The formatted report must be passed to the FileAgent."""
-            )
+            print("\n🚀 Stage 1: Extracting data from the REST API")
+            print("=" * 60)
 
-            # ============================================
-            # AGENT 3: File System Agent (OUTPUT & TERMINATION)
-            # ============================================
-            file_agent = AssistantAgent(
-                name="FileAgent",
-                model_client=model,
-                workbench=files,
-                # --- CHANGE HERE: ADD EXPLICIT TERMINATION PHRASE ---
-                system_message="""You are a file system expert.
-                Your final task is to take the formatted report from the DatabaseAgent.
-                Save this data to a file named 'round_robin_report.txt' using the filesystem:write_file tool.
-                After successfully confirming the file was created, you MUST output the phrase 'TERMINATE_CHAT' to end the conversation."""
-            )
+            rest_result = await Console(rest_agent.run_stream(task=initial_task))
+
+            # The REST agent's final message carries the data for both branches
+            rest_output = rest_result.messages[-1]
 
             # ============================================
-            # CHAT MANAGER SETUP 
+            # STAGE 2: LOAD (DB and File branches in parallel)
             # ============================================
 
-            # Define the order: REST -> DB -> File
-            agent_list = [rest_agent, db_agent, file_agent]
+            print("\n🚀 Stage 2: Loading data into the database and the report file (in parallel)")
+            print("=" * 60)
 
-            # The chat will stop when the message "TERMINATE_CHAT" appears.
-            termination_condition = TextMentionTermination(
-                text="TERMINATE_CHAT",
-                sources=[file_agent.name]  # Only look for the phrase from the final agent
-            )
+            branches = []
 
-            chat_manager = RoundRobinGroupChat(
-                participants=agent_list,
-                termination_condition=termination_condition  # Pass the condition to the manager
-            )
+            if db_agent is not None:
+                # The DB branch stops when the DatabaseAgent says "DB_DONE"
+                db_termination = TextMentionTermination(
+                    text="DB_DONE",
+                    sources=[db_agent.name]  # Only look for the phrase from the DatabaseAgent
+                )
+                branches.append((db_agent, run_branch(db_agent, rest_output, DB_BRANCH_MAX_TURNS, db_termination)))
+            else:
+                logger.warning("Skipping the database branch: the MySQL MCP server is not running")
 
-            # The initial task is for the first agent (RestApiAgent)
-            initial_task = "Begin the data pipeline: Extract user data using the rest:get tool."
+            if file_agent is not None:
+                # The File branch stops when the FileAgent says "TERMINATE_CHAT"
+                file_termination = TextMentionTermination(
+                    text="TERMINATE_CHAT",
+                    sources=[file_agent.name]  # Only look for the phrase from the FileAgent
+                )
+                branches.append((file_agent, run_branch(file_agent, rest_output, FILE_BRANCH_MAX_TURNS, file_termination)))
+            else:
+                logger.warning("Skipping the file branch: the file system MCP server is not running")
 
-            print("\n🚀 Starting Round-Robin Conversation (3 Steps)")
-            print("=" * 60)
+            # Run the branches side by side, then show each one's messages in turn
+            # (streaming both to the console at once would interleave them)
+            # A failing branch (e.g. a model rate limit) doesn't discard the other
+            # branch's result, and both have finished before the host is closed
+            results = await asyncio.gather(*(branch for _, branch in branches), return_exceptions=True)
 
-            # Run the chained conversation
-            await Console(
-                chat_manager.run_stream(task=initial_task)
-            )
+            failed_branches = []
+            for (agent, _), result in zip(branches, results):
+                if isinstance(result, BaseException):
+                    logger.error("%s branch failed: %r", agent.name, result, exc_info=result)
+                    failed_branches.append(agent.name)
+                else:
+                    await show_branch(agent, result)
 
             print("\n" + "=" * 60)
-            print("✅ ALL TASKS COMPLETED SUCCESSFULLY via Round-Robin Chat!")
+            if failed_branches:
+                print(f"❌ PIPELINE COMPLETED WITH FAILED BRANCHES: {', '.join(failed_branches)}")
+            elif host.failures:
+                print(f"⚠️ PIPELINE COMPLETED WITH SKIPPED BRANCHES (failed servers: {', '.join(host.failures)})")
+            else:
+                print("✅ ALL TASKS COMPLETED SUCCESSFULLY via the REST -> (DB || File) pipeline!")
             print("=" * 60)
 
     except Exception as e:
-        print(f"\n❌ Error occurred: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error occurred: %s", e)
+
+
+async def main():
+    """Run the pipeline once, then close the model clients on the same event loop."""
+    try:
+        await main_with_round_robin_chat()
+    finally:
+        await close_model_clients()
 
 
 if __name__ == "__main__":
-    asyncio.run(main_with_round_robin_chat())
+    asyncio.run(main())